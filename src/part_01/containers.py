@@ -1,7 +1,11 @@
 import csv
+import sys
+from operator import attrgetter
 from typing import List
 
 class Container:
+    __slots__ = ('initial', 'name', 'empty', 'capacity')
+
     def __init__(self, name: str, empty: int, capacity: int):
         self.initial = 0
         self.name = name
@@ -19,17 +23,17 @@ class ContainerManager:
     @classmethod
     def load_containers(cls, file_path: str) -> 'ContainerManager':
         instance = cls()  # Create a new instance of Containers
-        with open(file_path, 'r') as file:
+        with open(file_path, 'r', newline='', encoding='utf-8') as file:
             reader = csv.reader(file)
             next(reader)  # Skip the first row (header)
-            for row in reader:  # Process containers
-                name, empty, capacity = row
-                instance.containers.append(Container(name, int(empty), int(capacity)))  # Use instance's containers
+            instance.containers = [
+                Container(name, int(empty), int(capacity))
+                for name, empty, capacity in reader  # Build all containers in one pass
+            ]
         return instance  # Return the created instance
 
     def print_containers(self):
-        for container in sorted(self.containers, key=lambda x: x.name):
-            print(container)
+        sys.stdout.write("".join(f"{container}\n" for container in sorted(self.containers, key=attrgetter('name'))))
     
     def add_container(self, containers: List[Container]):
         self.containers.extend(containers)  # Add loaded containers to the list
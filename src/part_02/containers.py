@@ -1,23 +1,30 @@
 import csv
-from typing import List
+import sys
+from operator import attrgetter
+from typing import Dict, List
 from items import Item
 
 class Container:
+    __slots__ = ('name', 'container_weight', 'weight_capacity', 'items', '_cached_weight', '_key')
+
     def __init__(self, name: str, container_weight: int, weight_capacity: int):
         self.name:str = name
+        self._key:str = name.strip().lower()  # Normalised name used for lookups
         self.container_weight:int = container_weight
         self.weight_capacity:int = weight_capacity
 
         self.items:List[Item] = [] 
+        self._cached_weight:int = container_weight  # Kept up to date by add_item
 
     def __str__(self) -> str:
-        return (f"{self.name} (total weight: {self.get_current_weight()}, "
-                f"empty weight: {self.container_weight}, capacity: {self.get_current_weight()}/{self.weight_capacity})")
+        current_weight = self.get_current_weight()
+        return (f"{self.name} (total weight: {current_weight}, "
+                f"empty weight: {self.container_weight}, capacity: {current_weight}/{self.weight_capacity})")
     
     @classmethod
     def load_items(cls, file_path: str) -> 'Container':
         instance = cls()  # Create a new instance of Items
-        with open(file_path, 'r') as file:
+        with open(file_path, 'r', newline='', encoding='utf-8') as file:
             reader = csv.reader(file)
             next(reader)  # Skip the first row (header)
             for row in reader:  # Process items
@@ -26,9 +33,9 @@ class Container:
         return instance  # Return the created instance
     
     def add_item(self, item: Item):
-        if item.weight + self.get_current_weight() <= self.weight_capacity:
-            self.items.add_item(item)
-            self.current_weight += item.weight
+        if item.weight + self._cached_weight <= self.weight_capacity:
+            self.items.append(item)
+            self._cached_weight += item.weight
             print(f"Success! Item \"{item.name}\" stored in container \"{self.name}\".")
         else:
             print(f"Failure! Item \"{item.name}\" NOT stored in container \"{self.name}\".")
@@ -38,20 +45,15 @@ class Container:
             self.add_item(item)
     
     def get_current_weight(self):
-        current_weight = self.container_weight
-        for item in self.items:
-            print(item)
-            current_weight += item.weight
-        return current_weight
+        return self._cached_weight
 
     def list_items(self):
-            print(f"{self.name} (total weight: {self.get_current_weight()}, empty weight: {self.container_weight}, capacity: {self.get_current_weight()}/{self.weight_capacity})")
+            print(self)
             for item in self.items:
                 print(f"   {item}")
 
     def print_items(self):
-        for item in sorted(self.items, key=lambda x: x.name):
-            print(item)
+        sys.stdout.write("".join(f"{item}\n" for item in sorted(self.items, key=attrgetter('name'))))
 
     def get_item_by_name(self, item_name):
         for item in self.items:
@@ -67,33 +69,37 @@ class Container:
 class ContainerManager:
     def __init__(self):
         self.containers: List[Container] = []  # Initialize as an empty list
+        self._by_name: Dict[str, Container] = {}  # Normalised name -> container
 
     @classmethod
     def load_containers(cls, file_path: str) -> 'ContainerManager':
         instance = cls()  # Create a new instance of Containers
-        with open(file_path, 'r') as file:
+        with open(file_path, 'r', newline='', encoding='utf-8') as file:
             reader = csv.reader(file)
             next(reader)  # Skip the first row (header)
-            for row in reader:  # Process containers
-                name, empty, capacity = row
-                instance.containers.append(Container(name, int(empty), int(capacity)))  # Use instance's containers
+            append, _int, _Container = instance.containers.append, int, Container
+            for name, empty, capacity in reader:  # Process containers
+                append(_Container(name, _int(empty), _int(capacity)))  # Use instance's containers
+        instance._index_containers(instance.containers)
         return instance  # Return the created instance
 
     def print_containers(self):
-        for container in sorted(self.containers, key=lambda x: x.name):
-            print(container)
+        sys.stdout.write("".join(f"{container}\n" for container in sorted(self.containers, key=attrgetter('name'))))
     
     def add_container(self, containers: List[Container]):
         self.containers.extend(containers)  # Add loaded containers to the list
+        self._index_containers(containers)
+
+    def _index_containers(self, containers: List[Container]):
+        for container in containers:
+            # Keep the first container with a given name, as the linear scan did
+            self._by_name.setdefault(container._key, container)
             
     def get_containers(self) -> List[Container]:
         return self.containers
     
     def get_container_by_name(self, container_to_find:str) -> List[Container]:
-        for container in self.containers:
-            if container.name.strip().lower() == container_to_find.strip().lower():
-                return container
-        return None
+        return self._by_name.get(container_to_find.strip().lower())
     
     def get_count(self) -> int:
         return len(self.containers)
@@ -1,7 +1,11 @@
 import csv
+import sys
+from operator import attrgetter
 from typing import List
 
 class Item:
+    __slots__ = ('name', 'weight')
+
     def __init__(self, name: str, weight: int):
         self.name = name
         self.weight = weight
@@ -17,20 +21,19 @@ class ItemManager:
     @classmethod
     def load_items(cls, file_path: str) -> 'ItemManager':
         instance = cls()  # Create a new instance of Items
-        with open(file_path, 'r') as file:
+        with open(file_path, 'r', newline='', encoding='utf-8') as file:
             reader = csv.reader(file)
             next(reader)  # Skip the first row (header)
-            for row in reader:  # Process items
-                name, weight = row
-                instance.items.append(Item(name, int(weight)))  # Use instance's items
+            append, _int, _Item = instance.items.append, int, Item  # Bind once, outside the row loop
+            for name, weight in reader:  # Process items
+                append(_Item(name, _int(weight)))  # Use instance's items
         return instance  # Return the created instance
     
     def add_items(self, items: List[Item]):
         self.items.extend(items)  # Add loaded items to container
         
     def print_items(self):
-        for item in sorted(self.items, key=lambda x: x.name):
-            print(item)
+        sys.stdout.write("".join(f"{item}\n" for item in sorted(self.items, key=attrgetter('name'))))
             
     def get_items(self) -> List[Item]:
         return self.items
@@ -1,27 +1,34 @@
 import csv
-import copy
-from typing import List
+import sys
+from operator import attrgetter
+from typing import Dict, List
 from items import Item
 
 class Container(Item):
+    __slots__ = ('weight_capacity', 'items', 'is_multi_container', '_cached_weight', '_child_capacity', '_key')
+
     def __init__(self, name: str, weight: int, weight_capacity: int):
         super().__init__(name, weight)
+        self._key = name.strip().lower()  # Normalised name used for lookups
         self.weight_capacity = weight_capacity
         self.items: List[Item] = []
         self.is_multi_container = False
+        self._cached_weight = weight  # Kept up to date by add_item
+        self._child_capacity = 0  # Sum of child containers' capacities, kept up to date by add_item
 
     def __str__(self) -> str:
-        capacity_display = f"{self.get_current_weight()}/{self.weight_capacity}"
+        current_weight = self.get_current_weight()
+        capacity_display = f"{current_weight}/{self.weight_capacity}"
         if self.is_multi_container:
             capacity_display = "0/0"
-        return (f"{self.name} (total weight: {self.get_current_weight()}, "
+        return (f"{self.name} (total weight: {current_weight}, "
                 f"empty weight: {self.weight}, capacity: {capacity_display})")
 
     @classmethod
     def load_items(cls, file_path: str = None, items: List[Item] = None) -> 'Container':
         instance = cls("", 0, 0)
         if file_path:
-            with open(file_path, 'r') as file:
+            with open(file_path, 'r', newline='', encoding='utf-8') as file:
                 reader = csv.reader(file)
                 next(reader)
                 for name, weight in reader:
@@ -36,46 +43,61 @@ class Container(Item):
             self.items.append(item)
             self.is_multi_container = True
             self.weight += item.get_current_weight()
+            self._cached_weight += item.get_current_weight()
             self.weight_capacity += item.weight_capacity
+            self._child_capacity += item.weight_capacity
         else:
             for container in self.items:
-                if(isinstance(container, Container)):
+                # Only descend into compartments that can take the item, or that have compartments of their own
+                if(isinstance(container, Container) and (container.is_multi_container or container.has_room_for(item))):
                     if(container.add_item(item)):
+                        self._cached_weight += item.get_current_weight()
                         return True
                 
-            if item.get_current_weight() + self.get_current_weight() <= self.weight_capacity - self.get_child_container_capacity():
+            if self.has_room_for(item):
                 self.items.append(item)
+                self._cached_weight += item.get_current_weight()
                 print(f"Success! Item \"{item.name}\" stored in container \"{self.name}\".")
             else:
                 print(f"Failure! Item \"{item.name}\" NOT stored in container \"{self.name}\".")
                 return False
         return True
 
+    def has_room_for(self, item: Item) -> bool:
+        return item.get_current_weight() + self.get_current_weight() <= self.weight_capacity - self.get_child_container_capacity()
+
     def add_items(self, items: List[Item]):
         for item in items:
             self.add_item(item)
 
+    def clone(self) -> 'Container':
+        # Child containers are copied so the clone can be filled on its own; plain items are never mutated, so they are shared
+        container = type(self)(self.name, self.weight, self.weight_capacity)
+        container.items = [item.clone() if isinstance(item, Container) else item for item in self.items]
+        container.is_multi_container = self.is_multi_container
+        container._cached_weight = self._cached_weight
+        container._child_capacity = self._child_capacity
+        return container
+
     def get_child_container_capacity(self):
-        return sum(item.weight_capacity for item in self.items if isinstance(item, Container))
+        return self._child_capacity
 
     def get_current_weight(self):
-        print()
-        weight = 0
-        for item in self.items:
-            print("item: ", item)
-            weight += item.get_current_weight()
-            print("new_weight: ", weight)
-        self.weight + weight
-
-    def list_items(self, depth=1):
-        print(self)
-        for item in sorted(self.items, key=lambda x: x.name):
+        return self._cached_weight
+
+    def list_items(self):
+        lines = [f"{self}\n"]
+        # Depth-first walk with an explicit stack; children are pushed in reverse so they pop in name order
+        stack = [(item, 1) for item in reversed(sorted(self.items, key=attrgetter('name')))]
+        while stack:
+            item, depth = stack.pop()
             indent = "   " * depth
             if isinstance(item, Container):
-                print(indent, end="")
-                item.list_items(depth + 1)
+                lines.append(f"{indent}{item}\n")
+                stack.extend((child, depth + 1) for child in reversed(sorted(item.items, key=attrgetter('name'))))
             else:
-                print(f"{indent}{item.name} (weight: {item.weight})")
+                lines.append(f"{indent}{item.name} (weight: {item.weight})\n")
+        sys.stdout.write("".join(lines))
 
     def get_item_by_name(self, name: str) -> Item:
         return next((item for item in self.items if item.name == name), None)
@@ -89,23 +111,24 @@ class Container(Item):
 class ContainerManager:
     def __init__(self):
         self.containers: List[Container] = []  # Initialize as an empty list
+        self._by_name: Dict[str, Container] = {}  # Normalised name -> container
 
     @classmethod
     def load_containers(cls, file_path: str) -> 'ContainerManager':
         instance = cls()  # Create a new instance of ContainerManager
-        with open(file_path, 'r') as file:
+        with open(file_path, 'r', newline='', encoding='utf-8') as file:
             reader = csv.reader(file)
             next(reader)  # Skip header
-            instance.containers = [
+            instance.add_container([
                 Container(name, int(empty), int(capacity))
                 for name, empty, capacity in reader  # Use list comprehension
-            ]
+            ])
         return instance
 
     @classmethod
     def load_multi_containers(cls, containers_file_path: str, multi_container_file_path: str) -> 'ContainerManager':
         instance = cls.load_containers(containers_file_path)  # Load containers
-        with open(multi_container_file_path, 'r') as file:
+        with open(multi_container_file_path, 'r', newline='', encoding='utf-8') as file:
             reader = csv.reader(file)
             next(reader)  # Skip header
             for row in reader:
@@ -114,23 +137,25 @@ class ContainerManager:
                     child_container = instance.get_container_by_name(child_name)
                     if child_container:
                         mother_container.add_item(child_container)
-                instance.containers.append(mother_container)
+                instance.add_container([mother_container])
         return instance
 
     def print_containers(self):
-        for container in sorted(self.containers, key=lambda x: x.name):
+        for container in sorted(self.containers, key=attrgetter('name')):
             container.list_items()  # Assuming `Container` class has print_items()
 
     def add_container(self, containers: List[Container]):
         self.containers.extend(containers)
+        for container in containers:
+            self._by_name.setdefault(container._key, container)
 
     def get_containers(self) -> List[Container]:
         return self.containers
 
     def get_container_by_name(self, container_name: str) -> Container:
-        for container in self.containers:
-            if container.name.strip().lower() == container_name.strip().lower():
-                return copy.deepcopy(container)
+        container = self._by_name.get(container_name.strip().lower())
+        if container:
+            return container.clone()
         return None
 
     def get_count(self) -> int:
@@ -1,27 +1,36 @@
 import csv
-import copy
-from typing import List
+import sys
+from itertools import chain
+from typing import Dict, List
 from items import Item
 
 class Container(Item):
+    __slots__ = ('weight_capacity', 'items', '_sub_containers', 'is_multi_container',
+                 '_used_capacity', '_child_capacity', '_child_items_weight')
+
     def __init__(self, name: str, weight: int, weight_capacity: int):
         super().__init__(name, weight)
         self.weight_capacity = weight_capacity
-        self.items: List[Item] = []
+        self.items: List[Item] = []  # Everything stored here, in insertion order
+        self._sub_containers: List['Container'] = []  # The child containers among them, so the fit search never has to type-check
         self.is_multi_container = False
+        # Running totals, kept up to date by add_item
+        self._used_capacity = 0  # Weight of the items stored directly in this container
+        self._child_capacity = 0  # Sum of child containers' capacities
+        self._child_items_weight = 0  # Weight of the items stored directly in child containers
+
+    _FMT = '%s (total weight: %s, empty weight: %s, capacity: %s/%s)'
 
     def __str__(self) -> str:
-        capacity_display = f"{self.get_current_capacity()}/{self.weight_capacity}"
         if self.is_multi_container:
-            capacity_display = "0/0"
-        return (f"{self.name} (total weight: {self.get_current_weight()}, "
-                f"empty weight: {self.weight}, capacity: {capacity_display})")
+            return self._FMT % (self.name, self.get_current_weight(), self.weight, 0, 0)
+        return self._FMT % (self.name, self.get_current_weight(), self.weight, self._used_capacity, self.weight_capacity)
 
     @classmethod
     def load_items(cls, file_path: str = None, items: List[Item] = None) -> 'Container':
         instance = cls("", 0, 0)
         if file_path:
-            with open(file_path, 'r') as file:
+            with open(file_path, 'r', newline='', encoding='utf-8') as file:
                 reader = csv.reader(file)
                 next(reader)
                 for name, weight in reader:
@@ -34,22 +43,25 @@ class Container(Item):
     def add_item(self, item: Item, parent_container_name = None):
         if isinstance(item, Container):
             self.items.append(item)
+            self._sub_containers.append(item)
             self.is_multi_container = True
             self.weight += item.get_current_weight()
             self.weight_capacity += item.weight_capacity
+            self._child_capacity += item.weight_capacity
+            self._child_items_weight += item.get_item_weight()
         else:
-            for container in self.items:
-                if(isinstance(container, Container)):
-                    if(item.get_current_weight() + container.get_current_capacity() <= container.weight_capacity - container.get_child_container_capacity() or isinstance(item, Container)):
-                        container.add_item(item, self.name)
-                        return True
+            item_weight = item.get_current_weight()  # Read once, not once per compartment
+            for container in self._sub_containers:
+                used_capacity = container._used_capacity
+                if(item_weight + used_capacity <= container.weight_capacity - container._child_capacity):
+                    container.add_item(item, self.name)
+                    self._child_items_weight += container._used_capacity - used_capacity
+                    return True
                 
-            if item.get_current_weight() + self.get_current_capacity() <= self.weight_capacity - self.get_child_container_capacity():
+            if item_weight + self._used_capacity <= self.weight_capacity - self._child_capacity:
                 self.items.append(item)
-                if(parent_container_name):
-                    print(f"Success! Item \"{item.name}\" stored in container \"{parent_container_name}\".")
-                else:
-                    print(f"Success! Item \"{item.name}\" stored in container \"{self.name}\".")
+                self._used_capacity += item_weight
+                print(f"Success! Item \"{item.name}\" stored in container \"{parent_container_name or self.name}\".")
             else:
                 print(f"Failure! Item \"{item.name}\" NOT stored in container \"{self.name}\".")
                 return False
@@ -59,27 +71,44 @@ class Container(Item):
         for item in items:
             self.add_item(item)
 
+    def clone(self) -> 'Container':
+        container = type(self)(self.name, self.weight, self.weight_capacity)
+        for item in self.items:
+            if isinstance(item, Container):
+                item = item.clone()
+                container._sub_containers.append(item)
+            container.items.append(item)
+        container.is_multi_container = self.is_multi_container
+        container._used_capacity = self._used_capacity
+        container._child_capacity = self._child_capacity
+        container._child_items_weight = self._child_items_weight
+        return container
+
     def get_child_container_capacity(self):
-        return sum(item.weight_capacity for item in self.items if isinstance(item, Container))
+        return self._child_capacity
 
     def get_current_weight(self):
-        return self.weight + sum(item.get_item_weight() for item in self.items)
+        return self.weight + self._used_capacity + self._child_items_weight
     
     def get_item_weight(self):
-        return sum(item.get_current_weight() for item in self.items if not isinstance(item, Container))
+        return self._used_capacity
     
     def get_current_capacity(self):
-        return sum(item.get_current_weight() for item in self.items if not isinstance(item, Container))
-
-    def list_items(self, depth=1):
-        print(self)
-        for item in self.items:
+        return self._used_capacity
+
+    def list_items(self):
+        lines = [f"{self}\n"]
+        # Depth-first walk with an explicit stack; children are pushed in reverse so they pop in order
+        stack = [(item, 1) for item in reversed(self.items)]
+        while stack:
+            item, depth = stack.pop()
             indent = "   " * depth
             if isinstance(item, Container):
-                print(indent, end="")
-                item.list_items(depth + 1)
+                lines.append(f"{indent}{item}\n")
+                stack.extend((child, depth + 1) for child in reversed(item.items))
             else:
-                print(f"{indent}{item.name} (weight: {item.weight})")
+                lines.append(f"{indent}{item.name} (weight: {item.weight})\n")
+        sys.stdout.write("".join(lines))
 
     def get_item_by_name(self, name: str) -> Item:
         return next((item for item in self.items if item.name == name), None)
@@ -91,22 +120,24 @@ class Container(Item):
         return len(self.items)
     
 class MagicContainer(Container):
+    __slots__ = ()
+
     def __init__(self, name: str, weight: int, weight_capacity: int):
         super().__init__(name, weight, weight_capacity)
-        self.magic_capacity_filled = 0
 
     def add_item(self, item: Item):
         if isinstance(item, Container):
             self.items.append(item)
+            self._sub_containers.append(item)
             self.is_multi_container = True
             self.weight_capacity += item.weight_capacity
+            self._child_capacity += item.weight_capacity
         else:
-            for container in self.items:
-                if(isinstance(container, Container)):
-                    return container.add_item(item)
-                
-            if self.get_magic_capacity_filled() + item.get_current_weight() <= self.weight_capacity - self.get_child_container_capacity():
+            # Items are stored directly; the magic capacity is what decides, not the compartments
+            item_weight = item.get_current_weight()
+            if self._used_capacity + item_weight <= self.weight_capacity - self._child_capacity:
                 self.items.append(item)
+                self._used_capacity += item_weight
                 print(f"Success! Item \"{item.name}\" stored in container \"{self.name}\".")
             else:
                 print(f"Failure! Item \"{item.name}\" NOT stored in container \"{self.name}\".")
@@ -118,18 +149,18 @@ class MagicContainer(Container):
         return cls(magic_name, container.weight, container.weight_capacity)
    
     def get_magic_capacity_filled(self):
-        return sum(item.get_current_weight() for item in self.items if not isinstance(item, Container))
+        return self._used_capacity
 
     def get_current_weight(self):
         return self.weight
 
     def __str__(self) -> str:
-        capacity_display = f"{self.get_magic_capacity_filled()}/{self.weight_capacity}"
-        return (f"{self.name} (total weight: {self.get_current_weight()}, "
-                f"empty weight: {self.weight}, capacity: {capacity_display})")
+        return self._FMT % (self.name, self.get_current_weight(), self.weight, self._used_capacity, self.weight_capacity)
+
 class ContainerManager:
     def __init__(self):
         self.containers: List[Container] = []  # Initialize as an empty list
+        self._by_name: Dict[str, Container] = {}  # Normalised name -> container
 
     @classmethod
     def load_containers(cls, containers_file_path: str = None, multi_container_file_path: str = None, magic_container_file_path: str = None, multi_magic_container_file_path: str = None) -> 'ContainerManager':
@@ -137,53 +168,42 @@ class ContainerManager:
 
         # Load regular containers if the file path is provided
         if containers_file_path:
-            with open(containers_file_path, 'r') as file:
-                reader = csv.reader(file)
-                next(reader)  # Skip header
-                instance.containers = [
-                    Container(name, int(empty), int(capacity))
-                    for name, empty, capacity in reader
-                ]
+            instance.add_container([
+                Container(name, int(empty), int(capacity))
+                for name, empty, capacity in cls._read_rows(containers_file_path)
+            ])
 
         # Load multi containers if the file path is provided
         if multi_container_file_path:
-            with open(multi_container_file_path, 'r') as file:
-                reader = csv.reader(file)
-                next(reader)  # Skip header
-                for row in reader:
-                    mother_container = Container(row[0], 0, 0)  # First entry is the mother container name
-                    for child_name in row[1:]:
-                        child_container = instance.get_container_by_name(child_name)
-                        if child_container:
-                            mother_container.add_item(child_container)
-                    instance.containers.append(mother_container)
-
-        # Load magic containers if the file path is provided
-        if magic_container_file_path:
-            with open(magic_container_file_path, 'r') as file:
-                reader = csv.reader(file)
-                next(reader)  # Skip header
-                for row in reader:
-                    magic_container_name, container_name = row
-                    normal_container = instance.get_container_by_name(container_name)
-                    if normal_container:
-                        magic_container = MagicContainer.convert_container_to_magic(normal_container, magic_container_name)
-                        instance.containers.append(magic_container)
-
-        # Load multi-magic containers if the file path is provided
-        if multi_magic_container_file_path:
-            with open(multi_magic_container_file_path, 'r') as file:
-                reader = csv.reader(file)
-                next(reader)  # Skip header
-                for row in reader:
-                    magic_container_name, container_name = row
-                    normal_container = instance.get_container_by_name(container_name)
-                    if normal_container:
-                        magic_container = MagicContainer.convert_container_to_magic(normal_container, magic_container_name)
-                        instance.containers.append(magic_container)
+            for row in cls._read_rows(multi_container_file_path):
+                mother_container = Container(row[0], 0, 0)  # First entry is the mother container name
+                for child_name in row[1:]:
+                    child_container = instance.get_container_by_name(child_name)
+                    if child_container:
+                        mother_container.add_item(child_container)
+                instance.add_container([mother_container])
+
+        # Load magic and multi-magic containers if the file paths are provided; both files share one format
+        magic_rows = chain.from_iterable(
+            cls._read_rows(file_path)
+            for file_path in (magic_container_file_path, multi_magic_container_file_path)
+            if file_path
+        )
+        for magic_container_name, container_name in magic_rows:
+            # Only the weight and capacity are read, so the stored container is used without cloning it
+            normal_container = instance.get_container_by_name(container_name, clone=False)
+            if normal_container:
+                magic_container = MagicContainer.convert_container_to_magic(normal_container, magic_container_name)
+                instance.add_container([magic_container])
 
         return instance
 
+    @staticmethod
+    def _read_rows(file_path: str) -> List[List[str]]:
+        with open(file_path, 'r', newline='', encoding='utf-8') as file:
+            reader = csv.reader(file)
+            next(reader, None)  # Skip header
+            return list(reader)
 
     def print_containers(self):
         for container in self.containers:
@@ -191,14 +211,16 @@ class ContainerManager:
 
     def add_container(self, containers: List[Container]):
         self.containers.extend(containers)
+        for container in containers:
+            self._by_name.setdefault(container._key, container)
 
     def get_containers(self) -> List[Container]:
         return self.containers
 
-    def get_container_by_name(self, container_name: str) -> Container:
-        for container in self.containers:
-            if container.name.strip().lower() == container_name.strip().lower():
-                return copy.deepcopy(container)
+    def get_container_by_name(self, container_name: str, clone: bool = True) -> Container:
+        container = self._by_name.get(container_name.strip().lower())
+        if container:
+            return container.clone() if clone else container
         return None
 
     def get_count(self) -> int:
@@ -1,6 +1,6 @@
 import csv
-import copy
-from typing import List
+import sys
+from typing import Dict, List
 
 class Screen:
     # Base class for the different screen interfaces in the game.
@@ -16,18 +16,21 @@ class Screen:
 
     def run(self):
         # Main loop to run the screen and process user choices.
+        display_menu, get_choice, handle_choice = self.display_menu, self.get_choice, self.handle_choice  # Look up once
         while True:
-            self.display_menu()  # Show the menu options
-            choice = self.get_choice()  # Get user input
-            out = self.handle_choice(choice)  # Handle user input
+            display_menu()  # Show the menu options
+            out = handle_choice(get_choice())  # Get and handle user input
             if out:
-                break  # Exit loop if necessary
-        return out  # Return the final choice
+                return out  # Return the final choice
 
 class Item:
     # Represents an item with a name and weight.
+    __slots__ = ('name', '_key', 'weight')
+    is_container = False  # Lets list_items tell containers apart without isinstance
+
     def __init__(self, name: str, weight: int):
         self.name = name
+        self._key = name.strip().lower()  # Normalised once, used for name lookups
         self.weight = weight
 
     def __str__(self) -> str:
@@ -44,26 +47,41 @@ class Item:
 
 class Container(Item):
     # Represents a container that can hold multiple items and has a weight capacity.
+    __slots__ = ('weight_capacity', 'items', '_sub_containers', '_leaf_items', 'is_multi_container', '_cached_weight', '_str_cache', '_child_capacity')
+    is_container = True
+
     def __init__(self, name: str, weight: int, weight_capacity: int):
         super().__init__(name, weight)
         self.weight_capacity = weight_capacity
-        self.items: List[Item] = []  # Initialize with an empty list of items
+        self.items: List[Item] = []  # Everything stored here, in insertion order
+        self._sub_containers: List['Container'] = []  # The child containers among them
+        self._leaf_items: List[Item] = []  # The plain items among them
         self.is_multi_container = False  # Track if this container can hold other containers
+        self._cached_weight = None  # Computed on demand, reset by add_item
+        self._str_cache = None  # Rendered description, reset along with the weight
+        self._child_capacity = 0  # Capacity taken by child containers, updated by add_item
 
     def __str__(self) -> str:
-        # Display container details including current capacity and weight.
-        capacity_display = f"{self.get_current_capacity()}/{self.weight_capacity}"
-        if self.is_multi_container:
-            capacity_display = "0/0"  # Special handling for multi containers
-        return (f"{self.name} (total weight: {self.get_current_weight()}, "
-                f"empty weight: {self.weight}, capacity: {capacity_display})")
+        # Display container details including current capacity and weight, formatted once per change.
+        if self._str_cache is None:
+            capacity_display = f"{self.get_current_capacity()}/{self.weight_capacity}"
+            if self.is_multi_container:
+                capacity_display = "0/0"  # Special handling for multi containers
+            self._str_cache = (f"{self.name} (total weight: {self.get_current_weight()}, "
+                               f"empty weight: {self.weight}, capacity: {capacity_display})")
+        return self._str_cache
+
+    def _invalidate(self):
+        # Forget the cached weight and description after the contents change.
+        self._cached_weight = None
+        self._str_cache = None
 
     @classmethod
     def load_items(cls, file_path: str = None, items: List[Item] = None) -> 'Container':
         # Load items into a container either from a CSV file or from a given list.
         instance = cls("", 0, 0)
         if file_path:
-            with open(file_path, 'r') as file:
+            with open(file_path, 'r', newline='', encoding='utf-8') as file:
                 reader = csv.reader(file)
                 next(reader)  # Skip header row
                 for name, weight in reader:
@@ -77,28 +95,43 @@ class Container(Item):
         # Add an item to the container, checking weight capacity.
         if isinstance(item, Container):
             self.items.append(item)
+            self._sub_containers.append(item)
             self.is_multi_container = True  # Mark as multi container
             self.weight += item.get_current_weight()
             self.weight_capacity += item.weight_capacity
+            self._child_capacity += item.weight_capacity
+            self._invalidate()
         else:
-            # Check if the item can fit into a nested container.
-            for container in self.items:
-                if isinstance(container, Container):
-                    if (item.get_current_weight() + container.get_current_capacity() 
-                            <= container.weight_capacity - container.get_child_container_capacity()):
-                        container.add_item(item, self.name)
-                        return True
-
-            # Check if the item can fit into this container.
-            if item.get_current_weight() + self.get_current_capacity() <= self.weight_capacity - self.get_child_container_capacity():
-                self.items.append(item)
-                if parent_container_name:
-                    print(f"Success! Item \"{item.name}\" stored in container \"{parent_container_name}\".")
+            # Walk down to the deepest plain nested container the item fits in, one level at a time.
+            item_weight = item.get_current_weight()
+            path = [self]  # Containers whose weight changes if the item is stored
+            container = self
+            while True:
+                for child in container._sub_containers:
+                    if (item_weight + child.get_current_capacity()
+                            <= child.weight_capacity - child.get_child_container_capacity()):
+                        if type(child) is not Container:
+                            # Subclasses such as MagicContainer place the item their own way.
+                            stored = child.add_item(item)
+                            for changed in path:
+                                changed._invalidate()
+                            return stored
+                        parent_container_name = container.name
+                        container = child
+                        path.append(child)
+                        break
                 else:
-                    print(f"Success! Item \"{item.name}\" stored in container \"{self.name}\".")
-            else:
+                    break
+
+            # A nested container was only chosen because the item fits, so only this container needs checking.
+            if container is self and item_weight + self.get_current_capacity() > self.weight_capacity - self.get_child_container_capacity():
                 print(f"Failure! Item \"{item.name}\" NOT stored in container \"{self.name}\".")
                 return False
+            container.items.append(item)
+            container._leaf_items.append(item)
+            for changed in path:
+                changed._invalidate()
+            print(f"Success! Item \"{item.name}\" stored in container \"{parent_container_name or container.name}\".")
         return True
 
     def add_items(self, items: List[Item]):
@@ -106,32 +139,54 @@ class Container(Item):
         for item in items:
             self.add_item(item)
 
+    def clone(self) -> 'Container':
+        # Copy the container and its child containers; plain items are never mutated, so they are shared.
+        container = type(self)(self.name, self.weight, self.weight_capacity)
+        for item in self.items:
+            if item.is_container:
+                item = item.clone()
+                container._sub_containers.append(item)
+            else:
+                container._leaf_items.append(item)
+            container.items.append(item)
+        container.is_multi_container = self.is_multi_container
+        container._cached_weight = self._cached_weight
+        container._str_cache = self._str_cache
+        container._child_capacity = self._child_capacity
+        return container
+
     def get_child_container_capacity(self):
-        # Calculate the capacity taken by child containers.
-        return sum(item.weight_capacity for item in self.items if isinstance(item, Container))
+        # Return the capacity taken by child containers.
+        return self._child_capacity
 
     def get_current_weight(self):
-        # Calculate the current weight of the container including its contents.
-        return self.weight + sum(item.get_item_weight() for item in self.items)
+        # Calculate the current weight of the container including its contents, once per change.
+        if self._cached_weight is None:
+            self._cached_weight = (self.weight + sum(item.weight for item in self._leaf_items)
+                                   + sum(container.get_item_weight() for container in self._sub_containers))
+        return self._cached_weight
     
     def get_item_weight(self):
         # Calculate the total weight of items in the container (excluding child containers).
-        return sum(item.get_current_weight() for item in self.items if not isinstance(item, Container))
+        return sum(item.weight for item in self._leaf_items)
     
     def get_current_capacity(self):
         # Calculate the current used capacity of the container.
-        return sum(item.get_current_weight() for item in self.items if not isinstance(item, Container))
-
-    def list_items(self, depth=1):
-        # Recursively list all items in the container.
-        print(self)
-        for item in self.items:
+        return sum(item.weight for item in self._leaf_items)
+
+    def list_items(self):
+        # List all items in the container, walking child containers depth-first with an explicit stack.
+        lines = [f"{self}\n"]
+        stack = [(item, 1) for item in reversed(self.items)]  # Pushed in reverse, so they pop in insertion order
+        while stack:
+            item, depth = stack.pop()
             indent = "   " * depth  # Indentation for nested items
-            if isinstance(item, Container):
-                print(indent, end="")
-                item.list_items(depth + 1)  # Recursively list items in child containers
+            if item.is_container:
+                lines.append(f"{indent}{item}\n")
+                stack.extend((child, depth + 1) for child in reversed(item.items))  # List child containers' items next
             else:
-                print(f"{indent}{item.name} (weight: {item.weight})")
+                lines.append(f"{indent}{item.name} (weight: {item.weight})\n")
+        sys.stdout.write("".join(lines))  # Print the whole listing at once
 
     def get_item_by_name(self, name: str) -> Item:
         # Find an item by its name.
@@ -147,22 +202,27 @@ class Container(Item):
 class ItemManager:
     def __init__(self):
         self.items: List[Item] = []  # Initialize an empty list to store Item objects
+        self._by_name: Dict[str, Item] = {}  # Normalised name -> item, for lookups
 
     @classmethod
     def load_items(cls, file_path: str) -> 'ItemManager':
         """Loads items from a CSV file and returns an instance of ItemManager."""
         instance = cls()  # Create a new instance of ItemManager
-        with open(file_path, 'r') as file:
+        with open(file_path, 'r', newline='', encoding='utf-8') as file:
             reader = csv.reader(file)
             next(reader)  # Skip the header row
-            for row in reader:  # Iterate over rows and create items
-                name, weight = row
-                instance.items.append(Item(name, int(weight)))  # Append Item to the list
+            instance.add_items([Item(name, int(weight)) for name, weight in reader])  # Build all items in one pass
         return instance  # Return the populated instance
 
     def add_items(self, items: List[Item]):
         """Add multiple items to the ItemManager."""
         self.items.extend(items)  # Extend the list with new items
+        self._index_items(items)
+
+    def _index_items(self, items: List[Item]):
+        """Add items to the name index, keeping the first item with a given name."""
+        for item in items:
+            self._by_name.setdefault(item._key, item)
 
     def print_items(self):
         """Print all items in the ItemManager."""
@@ -175,16 +235,15 @@ class ItemManager:
 
     def get_item_by_name(self, item_to_find) -> List[Item]:
         """Find and return an item by its name."""
-        for item in self.items:
-            if item.name.strip().lower() == item_to_find.strip().lower():
-                return item  # Return the matching item
-        return None  # Return None if no match is found
+        return self._by_name.get(item_to_find.strip().lower())  # None if no match is found
 
     def get_count(self) -> int:
         """Return the total number of items."""
         return len(self.items)
 
 class MagicContainer(Container):
+    __slots__ = ('magic_capacity_filled',)
+
     def __init__(self, name: str, weight: int, weight_capacity: int):
         super().__init__(name, weight, weight_capacity)
         self.magic_capacity_filled = 0  # Track the current filled capacity of the magic container
@@ -194,22 +253,35 @@ class MagicContainer(Container):
         if isinstance(item, Container):
             # Add a container inside this container and adjust the weight capacity
             self.items.append(item)
+            self._sub_containers.append(item)
             self.is_multi_container = True
             self.weight_capacity += item.weight_capacity
+            self._child_capacity += item.weight_capacity
+            self._invalidate()
         else:
-            # Try adding to child containers first
-            for container in self.items:
-                if isinstance(container, Container):
-                    return container.add_item(item)
+            # Try adding to child containers first, skipping the ones the item cannot fit in
+            for container in self._sub_containers:
+                if (item.get_current_weight() + container.get_current_capacity()
+                        <= container.weight_capacity - container.get_child_container_capacity()):
+                    if container.add_item(item):
+                        return True
             # Add item if it fits in this container
             if self.get_magic_capacity_filled() + item.get_current_weight() <= self.weight_capacity - self.get_child_container_capacity():
                 self.items.append(item)
+                self._leaf_items.append(item)
+                self._invalidate()
                 print(f"Success! Item \"{item.name}\" stored in container \"{self.name}\".")
             else:
                 print(f"Failure! Item \"{item.name}\" NOT stored in container \"{self.name}\".")
                 return False
         return True
 
+    def clone(self) -> 'MagicContainer':
+        """Copy the container, including its filled capacity."""
+        container = super().clone()
+        container.magic_capacity_filled = self.magic_capacity_filled
+        return container
+
     @classmethod
     def convert_container_to_magic(cls, container: Container, magic_name):
         """Convert a regular container into a magic container."""
@@ -217,21 +289,24 @@ class MagicContainer(Container):
 
     def get_magic_capacity_filled(self):
         """Calculate the filled capacity based on the weight of stored items."""
-        return sum(item.get_current_weight() for item in self.items if not isinstance(item, Container))
+        return sum(item.weight for item in self._leaf_items)
 
     def get_current_weight(self):
         """Return the container's current weight."""
         return self.weight
 
     def __str__(self) -> str:
-        """Return a string representation of the container."""
-        capacity_display = f"{self.get_magic_capacity_filled()}/{self.weight_capacity}"
-        return (f"{self.name} (total weight: {self.get_current_weight()}, "
-                f"empty weight: {self.weight}, capacity: {capacity_display})")
+        """Return a string representation of the container, formatted once per change."""
+        if self._str_cache is None:
+            capacity_display = f"{self.get_magic_capacity_filled()}/{self.weight_capacity}"
+            self._str_cache = (f"{self.name} (total weight: {self.get_current_weight()}, "
+                               f"empty weight: {self.weight}, capacity: {capacity_display})")
+        return self._str_cache
 
 class ContainerManager:
     def __init__(self):
         self.containers: List[Container] = []  # Initialize an empty list to store Container objects
+        self._by_name: Dict[str, Container] = {}  # Normalised name -> container, for lookups
 
     @classmethod
     def load_containers(cls, containers_file_path: str = None, multi_container_file_path: str = None, magic_container_file_path: str = None, multi_magic_container_file_path: str = None) -> 'ContainerManager':
@@ -240,17 +315,17 @@ class ContainerManager:
 
         # Load regular containers from CSV
         if containers_file_path:
-            with open(containers_file_path, 'r') as file:
+            with open(containers_file_path, 'r', newline='', encoding='utf-8') as file:
                 reader = csv.reader(file)
                 next(reader)  # Skip the header
-                instance.containers = [
+                instance.add_container([
                     Container(name, int(empty), int(capacity))
                     for name, empty, capacity in reader
-                ]
+                ])
 
         # Load multi-containers where one container holds others
         if multi_container_file_path:
-            with open(multi_container_file_path, 'r') as file:
+            with open(multi_container_file_path, 'r', newline='', encoding='utf-8') as file:
                 reader = csv.reader(file)
                 next(reader)  # Skip header
                 for row in reader:
@@ -259,11 +334,11 @@ class ContainerManager:
                         child_container = instance.get_container_by_name(child_name)
                         if child_container:
                             mother_container.add_item(child_container)
-                    instance.containers.append(mother_container)
+                    instance.add_container([mother_container])
 
         # Load magic containers
         if magic_container_file_path:
-            with open(magic_container_file_path, 'r') as file:
+            with open(magic_container_file_path, 'r', newline='', encoding='utf-8') as file:
                 reader = csv.reader(file)
                 next(reader)  # Skip header
                 for row in reader:
@@ -271,11 +346,11 @@ class ContainerManager:
                     normal_container = instance.get_container_by_name(container_name)
                     if normal_container:
                         magic_container = MagicContainer.convert_container_to_magic(normal_container, magic_container_name)
-                        instance.containers.append(magic_container)
+                        instance.add_container([magic_container])
 
         # Load multi-magic containers
         if multi_magic_container_file_path:
-            with open(multi_magic_container_file_path, 'r') as file:
+            with open(multi_magic_container_file_path, 'r', newline='', encoding='utf-8') as file:
                 reader = csv.reader(file)
                 next(reader)  # Skip header
                 for row in reader:
@@ -283,7 +358,7 @@ class ContainerManager:
                     normal_container = instance.get_container_by_name(container_name)
                     if normal_container:
                         magic_container = MagicContainer.convert_container_to_magic(normal_container, magic_container_name)
-                        instance.containers.append(magic_container)
+                        instance.add_container([magic_container])
 
         return instance
 
@@ -295,6 +370,9 @@ class ContainerManager:
     def add_container(self, containers: List[Container]):
         """Add multiple containers to the ContainerManager."""
         self.containers.extend(containers)
+        for container in containers:
+            # Keep the first container with a given name, as the lookup always did
+            self._by_name.setdefault(container._key, container)
 
     def get_containers(self) -> List[Container]:
         """Return a list of all containers."""
@@ -302,9 +380,9 @@ class ContainerManager:
 
     def get_container_by_name(self, container_name: str) -> Container:
         """Find and return a container by its name."""
-        for container in self.containers:
-            if container.name.strip().lower() == container_name.strip().lower():
-                return copy.deepcopy(container)  # Return a copy to prevent modification
+        container = self._by_name.get(container_name.strip().lower())
+        if container:
+            return container.clone()  # Return a copy to prevent modification
         return None  # Return None if no match is found
 
     def get_count(self) -> int:
@@ -1,3 +1,4 @@
+from typing import Iterator, Optional
 from screens import Screen
 from containers import Container, ContainerManager
 from items import ItemManager
@@ -12,15 +13,15 @@ def print_items_and_containers(items:ItemManager , containers:ContainerManager):
     containers.print_containers()
 
 class ContainerSelectScreen(Screen):
-    def __init__(self, containers:ContainerManager) -> None:
-        super().__init__()
+    def __init__(self, containers:ContainerManager, input_source:Optional[Iterator[str]] = None) -> None:
+        super().__init__(input_source)
         self.containers: ContainerManager = containers
     
     def display_menu(self):
         return
 
     def get_choice(self):
-        return input("Enter the name of the container: ")
+        return self.read_input("Enter the name of the container: ")
 
     def handle_choice(self, choice):
         container = self.containers.get_container_by_name(choice)
@@ -30,8 +31,8 @@ class ContainerSelectScreen(Screen):
             print(f"\"{choice}\" not found. Try again.")
 
 class MainMenu(Screen):
-    def __init__(self, items:ItemManager = None, container:Container = None) -> None:
-        super().__init__()
+    def __init__(self, items:ItemManager = None, container:Container = None, input_source:Optional[Iterator[str]] = None) -> None:
+        super().__init__(input_source)
         self.items: ItemManager = items
         self.container: Container = container
 
@@ -58,7 +59,7 @@ class MainMenu(Screen):
     def handle_loot_item(self):
         """Loot an item by asking the user for the item name."""
         while True:
-            item_name = input("Enter the name of the item: ")
+            item_name = self.read_input("Enter the name of the item: ")
             item = self.items.get_item_by_name(item_name)
 
             if item:
@@ -1,9 +1,14 @@
 import csv
-from typing import List
+import sys
+from operator import attrgetter
+from typing import Dict, List
 
 class Item:
+    __slots__ = ('name', '_key', 'weight')
+
     def __init__(self, name: str, weight: int):
         self.name = name
+        self._key = sys.intern(name.strip().lower())  # Normalised name used for lookups
         self.weight = weight
 
     def __str__(self) -> str:
@@ -19,33 +24,35 @@ class Item:
 class ItemManager:
     def __init__(self):
         self.items: List[Item] = []  # Initialize as an empty list
+        self._by_name: Dict[str, Item] = {}  # Normalised name -> item
 
     @classmethod
     def load_items(cls, file_path: str) -> 'ItemManager':
         instance = cls()  # Create a new instance of Items
-        with open(file_path, 'r') as file:
+        with open(file_path, 'r', newline='', encoding='utf-8') as file:
             reader = csv.reader(file)
             next(reader)  # Skip the first row (header)
-            for row in reader:  # Process items
-                name, weight = row
-                instance.items.append(Item(name, int(weight)))  # Use instance's items
+            instance.add_items([Item(name, int(weight)) for name, weight in reader])  # Use list comprehension
         return instance  # Return the created instance
     
     def add_items(self, items: List[Item]):
         self.items.extend(items)  # Add loaded items to container
+        self._index_items(items)
+
+    def _index_items(self, items: List[Item]):
+        for item in items:
+            # Keep the first item with a given name, as the linear scan did
+            self._by_name.setdefault(item._key, item)
         
     def print_items(self):
-        for item in sorted(self.items, key=lambda x: x.name):
+        for item in sorted(self.items, key=attrgetter('name')):
             print(item)
             
     def get_items(self) -> List[Item]:
         return self.items
     
     def get_item_by_name(self, item_to_find) -> List[Item]:
-        for item in self.items:
-            if item.name.strip().lower() == item_to_find.strip().lower():
-                return item
-        return None
+        return self._by_name.get(item_to_find.strip().lower())
     
     def get_count(self) -> int:
         return len(self.items)
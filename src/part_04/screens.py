@@ -1,9 +1,23 @@
+from typing import Iterator, Optional
+
 class Screen:
+    def __init__(self, input_source: Optional[Iterator[str]] = None) -> None:
+        # Lines to read instead of stdin, e.g. iter(["1", "A rock", "0"]) for a scripted run
+        self.input_source = input_source
+
     def display_menu(self):
         raise NotImplementedError("This method should be overridden by subclasses.")
 
+    def read_input(self, prompt: str = "") -> str:
+        if self.input_source is None:
+            return input(prompt)
+        try:
+            return next(self.input_source)
+        except StopIteration:
+            raise EOFError("Scripted input exhausted.") from None
+
     def get_choice(self):
-        return input("")
+        return self.read_input("")
 
     def handle_choice(self, choice):
         raise NotImplementedError("This method should be overridden by subclasses.")
@@ -1,14 +1,21 @@
 import csv
-import copy
-from typing import List
+import sys
+from typing import Dict, List
 from items import Item
 
 class Container(Item):
+    __slots__ = ('weight_capacity', 'items', 'is_multi_container',
+                 '_used_capacity', '_child_capacity', '_child_items_weight')
+    is_container = True
+
     def __init__(self, name: str, weight: int, weight_capacity: int):
         super().__init__(name, weight)
         self.weight_capacity = weight_capacity
         self.items: List[Item] = []
         self.is_multi_container = False
+        self._used_capacity = 0  # Weight of the items stored directly in this container
+        self._child_capacity = 0  # Sum of child containers' capacities
+        self._child_items_weight = 0  # Weight of the items stored directly in child containers
 
     def __str__(self) -> str:
         capacity_display = f"{self.get_current_capacity()}/{self.weight_capacity}"
@@ -21,7 +28,7 @@ class Container(Item):
     def load_items(cls, file_path: str = None, items: List[Item] = None) -> 'Container':
         instance = cls("", 0, 0)
         if file_path:
-            with open(file_path, 'r') as file:
+            with open(file_path, 'r', newline='', encoding='utf-8') as file:
                 reader = csv.reader(file)
                 next(reader)
                 for name, weight in reader:
@@ -32,20 +39,26 @@ class Container(Item):
         return instance
 
     def add_item(self, item: Item, parent_container_name = None):
-        if isinstance(item, Container):
+        if item.is_container:
             self.items.append(item)
             self.is_multi_container = True
             self.weight += item.get_current_weight()
             self.weight_capacity += item.weight_capacity
+            self._child_capacity += item.weight_capacity
+            self._child_items_weight += item.get_item_weight()
         else:
+            item_weight = item.get_current_weight()  # Read once, not once per compartment
             for container in self.items:
-                if(isinstance(container, Container)):
-                    if(item.get_current_weight() + container.get_current_capacity() <= container.weight_capacity - container.get_child_container_capacity() or isinstance(item, Container)):
+                if(container.is_container):
+                    if(item_weight + container._used_capacity <= container.weight_capacity - container._child_capacity):
+                        stored_before = container.get_item_weight()
                         container.add_item(item, self.name)
+                        self._child_items_weight += container.get_item_weight() - stored_before
                         return True
                 
-            if item.get_current_weight() + self.get_current_capacity() <= self.weight_capacity - self.get_child_container_capacity():
+            if item_weight + self._used_capacity <= self.weight_capacity - self._child_capacity:
                 self.items.append(item)
+                self._used_capacity += item_weight
                 if(parent_container_name):
                     print(f"Success! Item \"{item.name}\" stored in container \"{parent_container_name}\".")
                 else:
@@ -59,27 +72,40 @@ class Container(Item):
         for item in items:
             self.add_item(item)
 
+    def clone(self) -> 'Container':
+        container = type(self)(self.name, self.weight, self.weight_capacity)
+        container.items = [item.clone() if item.is_container else item for item in self.items]
+        container.is_multi_container = self.is_multi_container
+        container._used_capacity = self._used_capacity
+        container._child_capacity = self._child_capacity
+        container._child_items_weight = self._child_items_weight
+        return container
+
     def get_child_container_capacity(self):
-        return sum(item.weight_capacity for item in self.items if isinstance(item, Container))
+        return self._child_capacity
 
     def get_current_weight(self):
-        return self.weight + sum(item.get_item_weight() for item in self.items)
+        return self.weight + self._used_capacity + self._child_items_weight
     
     def get_item_weight(self):
-        return sum(item.get_current_weight() for item in self.items if not isinstance(item, Container))
+        return self._used_capacity
     
     def get_current_capacity(self):
-        return sum(item.get_current_weight() for item in self.items if not isinstance(item, Container))
-
-    def list_items(self, depth=1):
-        print(self)
-        for item in self.items:
+        return self._used_capacity
+
+    def list_items(self):
+        lines = [f"{self}\n"]
+        # Depth-first walk with an explicit stack; children are pushed in reverse so they pop in order
+        stack = [(item, 1) for item in reversed(self.items)]
+        while stack:
+            item, depth = stack.pop()
             indent = "   " * depth
-            if isinstance(item, Container):
-                print(indent, end="")
-                item.list_items(depth + 1)
+            if item.is_container:
+                lines.append(f"{indent}{item}\n")
+                stack.extend((child, depth + 1) for child in reversed(item.items))
             else:
-                print(f"{indent}{item.name} (weight: {item.weight})")
+                lines.append(f"{indent}{item.name} (weight: {item.weight})\n")
+        sys.stdout.write("".join(lines))
 
     def get_item_by_name(self, name: str) -> Item:
         return next((item for item in self.items if item.name == name), None)
@@ -91,23 +117,30 @@ class Container(Item):
         return len(self.items)
     
 class MagicContainer(Container):
+    __slots__ = ()
+
     def __init__(self, name: str, weight: int, weight_capacity: int):
         super().__init__(name, weight, weight_capacity)
 
     def add_item(self, item: Item, parent_container_name = None):
-        if isinstance(item, Container):
+        if item.is_container:
             self.items.append(item)
             self.is_multi_container = True
             self.weight_capacity += item.weight_capacity
+            self._child_capacity += item.weight_capacity
         else:
+            item_weight = item.get_current_weight()
             for container in self.items:
-                if(isinstance(container, Container)):
-                    if(container.get_current_capacity() + item.get_current_weight() <= container.weight_capacity - container.get_child_container_capacity() or isinstance(item, Container)):
+                if(container.is_container):
+                    if(item_weight + container._used_capacity <= container.weight_capacity - container._child_capacity):
+                        stored_before = container.get_item_weight()
                         container.add_item(item, self.name)
+                        self._child_items_weight += container.get_item_weight() - stored_before
                         return True
                 
-            if self.get_current_capacity() + item.get_current_weight() <= self.weight_capacity - self.get_child_container_capacity():
+            if item_weight + self._used_capacity <= self.weight_capacity - self._child_capacity:
                 self.items.append(item)
+                self._used_capacity += item_weight
                 if(parent_container_name):
                     print(f"Success! Item \"{item.name}\" stored in container \"{parent_container_name}\".")
                 else:
@@ -122,10 +155,10 @@ class MagicContainer(Container):
         instance = cls(magic_name, container.weight, container.weight_capacity)
         instance.is_multi_container = container.is_multi_container
         instance.items = container.items
+        instance._used_capacity = container._used_capacity
+        instance._child_capacity = container._child_capacity
+        instance._child_items_weight = container._child_items_weight
         return instance
-   
-    def get_current_capacity(self):
-        return sum(item.get_current_weight() for item in self.items if not isinstance(item, Container))
 
     def get_current_weight(self):
         return self.weight
@@ -140,6 +173,7 @@ class MagicContainer(Container):
 class ContainerManager:
     def __init__(self):
         self.containers: List[Container] = []  # Initialize as an empty list
+        self._by_name: Dict[str, Container] = {}  # Normalised name -> container
 
     @classmethod
     def load_containers(cls, containers_file_path: str = None, multi_container_file_path: str = None, magic_container_file_path: str = None, multi_magic_container_file_path: str = None) -> 'ContainerManager':
@@ -147,30 +181,31 @@ class ContainerManager:
 
         # Load regular containers if the file path is provided
         if containers_file_path:
-            with open(containers_file_path, 'r') as file:
+            with open(containers_file_path, 'r', newline='', encoding='utf-8') as file:
                 reader = csv.reader(file)
                 next(reader)  # Skip header
-                instance.containers = [
+                instance.add_container([
                     Container(name, int(empty), int(capacity))
                     for name, empty, capacity in reader
-                ]
+                ])
 
         # Load multi containers if the file path is provided
         if multi_container_file_path:
-            with open(multi_container_file_path, 'r') as file:
+            with open(multi_container_file_path, 'r', newline='', encoding='utf-8') as file:
                 reader = csv.reader(file)
                 next(reader)  # Skip header
+                get_container_by_name = instance.get_container_by_name
                 for row in reader:
                     mother_container = Container(row[0], 0, 0)  # First entry is the mother container name
                     for child_name in row[1:]:
-                        child_container = instance.get_container_by_name(child_name)
+                        child_container = get_container_by_name(child_name)
                         if child_container:
                             mother_container.add_item(child_container)
-                    instance.containers.append(mother_container)
+                    instance.add_container([mother_container])
 
         # Load magic containers if the file path is provided
         if magic_container_file_path:
-            with open(magic_container_file_path, 'r') as file:
+            with open(magic_container_file_path, 'r', newline='', encoding='utf-8') as file:
                 reader = csv.reader(file)
                 next(reader)  # Skip header
                 for row in reader:
@@ -178,11 +213,11 @@ class ContainerManager:
                     normal_container = instance.get_container_by_name(container_name)
                     if normal_container:
                         magic_container = MagicContainer.convert_container_to_magic(normal_container, magic_container_name)
-                        instance.containers.append(magic_container)
+                        instance.add_container([magic_container])
 
         # Load multi-magic containers if the file path is provided
         if multi_magic_container_file_path:
-            with open(multi_magic_container_file_path, 'r') as file:
+            with open(multi_magic_container_file_path, 'r', newline='', encoding='utf-8') as file:
                 reader = csv.reader(file)
                 next(reader)  # Skip header
                 for row in reader:
@@ -190,7 +225,7 @@ class ContainerManager:
                     normal_container = instance.get_container_by_name(container_name)
                     if normal_container:
                         magic_container = MagicContainer.convert_container_to_magic(normal_container, magic_container_name)
-                        instance.containers.append(magic_container)
+                        instance.add_container([magic_container])
 
         return instance
 
@@ -201,14 +236,16 @@ class ContainerManager:
 
     def add_container(self, containers: List[Container]):
         self.containers.extend(containers)
+        for container in containers:
+            self._by_name.setdefault(container._key, container)
 
     def get_containers(self) -> List[Container]:
         return self.containers
 
     def get_container_by_name(self, container_name: str) -> Container:
-        for container in self.containers:
-            if container.name.strip().lower() == container_name.strip().lower():
-                return copy.deepcopy(container)
+        container = self._by_name.get(container_name.strip().lower())
+        if container:
+            return container.clone()
         return None
 
     def get_count(self) -> int:
@@ -1,7 +1,9 @@
-from screens import Screen
+from screens import Screen, read_line
 from containers import Container, ContainerManager
 from items import ItemManager
 
+_QUIT = object()  # Returned by MainMenu.handle_choice to end its run() loop
+
 def print_items_and_containers(items:ItemManager , containers:ContainerManager):
     print(f"Initialised {items.get_count()+containers.get_count()} items including {containers.get_count()} containers.\n")
     
@@ -20,7 +22,7 @@ class ContainerSelectScreen(Screen):
         return
 
     def get_choice(self):
-        return input("Enter the name of the container: ")
+        return read_line("Enter the name of the container: ")
 
     def handle_choice(self, choice):
         container = self.containers.get_container_by_name(choice)
@@ -50,15 +52,14 @@ class MainMenu(Screen):
         elif choice == "2":
             self.list_looted_items()
         elif choice == "0":
-            
-            exit()
+            return _QUIT
         else:
             print("Invalid choice. Try again.")
     
     def handle_loot_item(self):
         """Loot an item by asking the user for the item name."""
         while True:
-            item_name = input("Enter the name of the item: ")
+            item_name = read_line("Enter the name of the item: ")
             item = self.items.get_item_by_name(item_name)
 
             if item:
@@ -1,18 +1,29 @@
+import sys
+
+def read_line(prompt: str = "") -> str:
+    # Same contract as input(), without its per-call prompt and terminal handling
+    if prompt:
+        sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()  # Looked up per call, so a replaced sys.stdin is honoured
+    if not line:
+        raise EOFError("EOF when reading a line")
+    return line.rstrip("\n")
+
 class Screen:
     def display_menu(self):
         raise NotImplementedError("This method should be overridden by subclasses.")
 
     def get_choice(self):
-        return input("")
+        return read_line("")
 
     def handle_choice(self, choice):
         raise NotImplementedError("This method should be overridden by subclasses.")
 
     def run(self):
+        display_menu, get_choice, handle_choice = self.display_menu, self.get_choice, self.handle_choice  # Look up once
         while True:
-            self.display_menu()
-            choice = self.get_choice()
-            out = self.handle_choice(choice)
+            display_menu()
+            out = handle_choice(get_choice())
             if(out):
-                break
-        return out
\ No newline at end of file
+                return out
\ No newline at end of file
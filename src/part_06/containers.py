@@ -1,14 +1,22 @@
 import csv
-import copy
-from typing import List
+import sys
+from itertools import chain
+from typing import Dict, List, Optional
 from items import Item
 
 class Container(Item):
+    __slots__ = ('weight_capacity', 'items', 'is_multi_container',
+                 '_used_capacity', '_child_capacity', '_child_items_weight')
+    is_container = True
+
     def __init__(self, name: str, weight: int, weight_capacity: int):
         super().__init__(name, weight)
         self.weight_capacity = weight_capacity
         self.items: List[Item] = []
         self.is_multi_container = False
+        self._used_capacity = 0  # Weight of the plain items stored directly in this container
+        self._child_capacity = 0  # Sum of child containers' capacities
+        self._child_items_weight = 0  # Weight of the plain items stored directly in child containers
 
     def __str__(self) -> str:
         capacity_display = f"{self.get_current_capacity()}/{self.weight_capacity}"
@@ -21,7 +29,7 @@ class Container(Item):
     def load_items(cls, file_path: str = None, items: List[Item] = None) -> 'Container':
         instance = cls("", 0, 0)
         if file_path:
-            with open(file_path, 'r') as file:
+            with open(file_path, 'r', newline='', encoding='utf-8') as file:
                 reader = csv.reader(file)
                 next(reader)
                 for name, weight in reader:
@@ -32,19 +40,24 @@ class Container(Item):
         return instance
 
     def add_item(self, item: Item, parent_container_name = None, start_load=False, depth=0):
-        if (isinstance(item, Container) and start_load):
+        if (item.is_container and start_load):
             self.items.append(item)
             self.is_multi_container = True
             self.weight += item.get_current_weight()
             self.weight_capacity += item.weight_capacity
+            self._add_to_totals(item)
         else:
+            item_weight = item.get_current_weight()  # Read once, not once per compartment
             for container in self.items:
-                if(isinstance(container, Container)):
-                    if(item.get_current_weight() + container.get_current_capacity() <= container.weight_capacity):
+                if(container.is_container):
+                    if(item_weight + container._used_capacity <= container.weight_capacity):
                         if(depth<0):
+                            stored_before = container.get_item_weight()
                             container.add_item(item, self.name, depth=depth+1)
+                            self._child_items_weight += container.get_item_weight() - stored_before
                         else:
                             self.items.append(item)
+                            self._add_to_totals(item)
                             if(parent_container_name):
                                 print(f"Success! Item \"{item.name}\" stored in container \"{parent_container_name}\".")
                             else:
@@ -54,8 +67,9 @@ class Container(Item):
                     else:
                         print("SKIPPED")
                 
-            if item.get_current_weight() + self.get_current_capacity() <= self.weight_capacity:
+            if item_weight + self._used_capacity <= self.weight_capacity:
                 self.items.append(item)
+                self._add_to_totals(item)
                 if(parent_container_name):
                     print(f"Success! Item \"{item.name}\" stored in container \"{parent_container_name}\".")
                 else:
@@ -69,29 +83,51 @@ class Container(Item):
         for item in items:
             self.add_item(item)
 
+    def clone(self) -> 'Container':
+        container = type(self)(self.name, self.weight, self.weight_capacity)
+        container.items = [item.clone() if item.is_container else item for item in self.items]
+        container.is_multi_container = self.is_multi_container
+        container._used_capacity = self._used_capacity
+        container._child_capacity = self._child_capacity
+        container._child_items_weight = self._child_items_weight
+        return container
+
+    def _add_to_totals(self, item: Item):
+        # A stored container counts by its capacity and its own items' weight, never against this container's capacity
+        if item.is_container:
+            self._child_capacity += item.weight_capacity
+            self._child_items_weight += item.get_item_weight()
+        else:
+            self._used_capacity += item.get_current_weight()
+
     def get_child_container_capacity(self):
-        return sum(item.weight_capacity for item in self.items if isinstance(item, Container))
+        return self._child_capacity
 
     def get_current_weight(self):
-        return self.weight + sum(item.get_item_weight() for item in self.items)
+        return self.weight + self._used_capacity + self._child_items_weight
     
     def get_item_weight(self):
-        return sum(item.get_current_weight() for item in self.items if not isinstance(item, Container))
+        return self._used_capacity
     
     def get_current_capacity(self):
-        return sum(item.get_current_weight() for item in self.items if not isinstance(item, Container))
-
-    def list_items(self, depth=1):
-        print(self)
-        for item in self.items:
-            indent = "   " * depth
-            if isinstance(item, Container):
-                print(indent, end="")
-                item.list_items(depth + 1)
+        return self._used_capacity
+
+    def list_items(self):
+        lines = [f"{self}\n"]
+        # Depth-first walk with an explicit stack; children are pushed in reverse so they pop in order.
+        # Each entry carries its indent, built once per container rather than once per line
+        stack = [(item, "   ") for item in reversed(self.items)]
+        while stack:
+            item, indent = stack.pop()
+            if item.is_container:
+                lines.append(f"{indent}{item}\n")
+                child_indent = indent + "   "
+                stack.extend((child, child_indent) for child in reversed(item.items))
             else:
-                print(f"{indent}{item.name} (weight: {item.weight})")
+                lines.append(f"{indent}{item.name} (weight: {item.weight})\n")
+        sys.stdout.write("".join(lines))
 
-    def get_item_by_name(self, name: str) -> Item:
+    def get_item_by_name(self, name: str) -> Optional[Item]:
         return next((item for item in self.items if item.name == name), None)
 
     def get_items(self) -> List[Item]:
@@ -101,30 +137,38 @@ class Container(Item):
         return len(self.items)
     
 class MagicContainer(Container):
+    __slots__ = ()
+
     def __init__(self, name: str, weight: int, weight_capacity: int):
         super().__init__(name, weight, weight_capacity)
 
     def add_item(self, item: Item, parent_container_name = None, start_load=False, depth=0):
-        if (isinstance(item, Container) and start_load):
+        if (item.is_container and start_load):
             self.items.append(item)
             self.is_multi_container = True
             self.weight_capacity += item.weight_capacity
+            self._add_to_totals(item)
         else:
+            item_weight = item.get_current_weight()
             for container in self.items:
-                if(isinstance(container, Container)):
-                    if(container.get_current_capacity() + item.get_current_weight() <= container.weight_capacity):
+                if(container.is_container):
+                    if(container._used_capacity + item_weight <= container.weight_capacity):
                         if(depth<0):
+                            stored_before = container.get_item_weight()
                             container.add_item(item, self.name)
+                            self._child_items_weight += container.get_item_weight() - stored_before
                         else:
                             self.items.append(item)
+                            self._add_to_totals(item)
                             if(parent_container_name):
                                 print(f"Success! Item \"{item.name}\" stored in container \"{parent_container_name}\".")
                             else:
                                 print(f"Success! Item \"{item.name}\" stored in container \"{self.name}\".")
                         return True
                 
-            if self.get_current_capacity() + item.get_current_weight() <= self.weight_capacity:
+            if self._used_capacity + item_weight <= self.weight_capacity:
                 self.items.append(item)
+                self._add_to_totals(item)
                 if(parent_container_name):
                     print(f"Success! Item \"{item.name}\" stored in container \"{parent_container_name}\".")
                 else:
@@ -139,10 +183,10 @@ class MagicContainer(Container):
         instance = cls(magic_name, container.weight, container.weight_capacity)
         instance.is_multi_container = container.is_multi_container
         instance.items = container.items
+        instance._used_capacity = container._used_capacity
+        instance._child_capacity = container._child_capacity
+        instance._child_items_weight = container._child_items_weight
         return instance
-   
-    def get_current_capacity(self):
-        return sum(item.get_current_weight() for item in self.items if not isinstance(item, Container))
 
     def get_current_weight(self):
         return self.weight
@@ -157,6 +201,7 @@ class MagicContainer(Container):
 class ContainerManager:
     def __init__(self):
         self.containers: List[Container] = []  # Initialize as an empty list
+        self._by_name: Dict[str, Container] = {}  # Normalised name -> container
 
     @classmethod
     def load_containers(cls, containers_file_path: str = None, multi_container_file_path: str = None, magic_container_file_path: str = None, multi_magic_container_file_path: str = None) -> 'ContainerManager':
@@ -164,53 +209,41 @@ class ContainerManager:
 
         # Load regular containers if the file path is provided
         if containers_file_path:
-            with open(containers_file_path, 'r') as file:
-                reader = csv.reader(file)
-                next(reader)  # Skip header
-                instance.containers = [
-                    Container(name, int(empty), int(capacity))
-                    for name, empty, capacity in reader
-                ]
+            instance.add_container([
+                Container(name, int(empty), int(capacity))
+                for name, empty, capacity in cls._read_rows(containers_file_path)
+            ])
 
         # Load multi containers if the file path is provided
         if multi_container_file_path:
-            with open(multi_container_file_path, 'r') as file:
-                reader = csv.reader(file)
-                next(reader)  # Skip header
-                for row in reader:
-                    mother_container = Container(row[0], 0, 0)  # First entry is the mother container name
-                    for child_name in row[1:]:
-                        child_container = instance.get_container_by_name(child_name)
-                        if child_container:
-                            mother_container.add_item(child_container, start_load=True)
-                    instance.containers.append(mother_container)
-
-        # Load magic containers if the file path is provided
-        if magic_container_file_path:
-            with open(magic_container_file_path, 'r') as file:
-                reader = csv.reader(file)
-                next(reader)  # Skip header
-                for row in reader:
-                    magic_container_name, container_name = row
-                    normal_container = instance.get_container_by_name(container_name)
-                    if normal_container:
-                        magic_container = MagicContainer.convert_container_to_magic(normal_container, magic_container_name)
-                        instance.containers.append(magic_container)
-
-        # Load multi-magic containers if the file path is provided
-        if multi_magic_container_file_path:
-            with open(multi_magic_container_file_path, 'r') as file:
-                reader = csv.reader(file)
-                next(reader)  # Skip header
-                for row in reader:
-                    magic_container_name, container_name = row
-                    normal_container = instance.get_container_by_name(container_name)
-                    if normal_container:
-                        magic_container = MagicContainer.convert_container_to_magic(normal_container, magic_container_name)
-                        instance.containers.append(magic_container)
+            for row in cls._read_rows(multi_container_file_path):
+                mother_container = Container(row[0], 0, 0)  # First entry is the mother container name
+                for child_name in row[1:]:
+                    child_container = instance.get_container_by_name(child_name)
+                    if child_container:
+                        mother_container.add_item(child_container, start_load=True)
+                instance.add_container([mother_container])
+
+        # Load magic and multi-magic containers if the file paths are provided; both files share one format
+        magic_rows = chain.from_iterable(
+            cls._read_rows(file_path)
+            for file_path in (magic_container_file_path, multi_magic_container_file_path)
+            if file_path
+        )
+        for magic_container_name, container_name in magic_rows:
+            normal_container = instance.get_container_by_name(container_name)
+            if normal_container:
+                magic_container = MagicContainer.convert_container_to_magic(normal_container, magic_container_name)
+                instance.add_container([magic_container])
 
         return instance
 
+    @staticmethod
+    def _read_rows(file_path: str) -> List[List[str]]:
+        with open(file_path, 'r', newline='', encoding='utf-8') as file:
+            reader = csv.reader(file)
+            next(reader, None)  # Skip header
+            return list(reader)
 
     def print_containers(self):
         for container in self.containers:
@@ -218,14 +251,20 @@ class ContainerManager:
 
     def add_container(self, containers: List[Container]):
         self.containers.extend(containers)
+        for container in containers:
+            self._by_name.setdefault(container._key, container)
 
     def get_containers(self) -> List[Container]:
         return self.containers
 
-    def get_container_by_name(self, container_name: str) -> Container:
-        for container in self.containers:
-            if container.name.strip().lower() == container_name.strip().lower():
-                return copy.deepcopy(container)
+    def get_container_by_name(self, container_name: str) -> Optional[Container]:
+        return self.get_container_by_key(container_name.strip().lower())
+
+    def get_container_by_key(self, key: str) -> Optional[Container]:
+        # key must already be stripped and lower-cased
+        container = self._by_name.get(key)
+        if container:
+            return container.clone()
         return None
 
     def get_count(self) -> int:
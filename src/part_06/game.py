@@ -1,7 +1,16 @@
+import sys
 from screens import Screen
 from containers import Container, ContainerManager
 from items import ItemManager
 
+_MAIN_MENU = ("==================================\n"
+              "Enter your choice:\n"
+              "1. Loot item.\n"
+              "2. List looted items.\n"
+              "0. Quit.\n"
+              "==================================\n")
+_QUIT = object()  # Returned by MainMenu.handle_choice to end its run() loop
+
 def print_items_and_containers(items:ItemManager , containers:ContainerManager):
     print(f"Initialised {items.get_count()+containers.get_count()} items including {containers.get_count()} containers.\n")
     
@@ -37,12 +46,7 @@ class MainMenu(Screen):
         self.container: Container = container
 
     def display_menu(self):
-        print("==================================")
-        print("Enter your choice:")
-        print("1. Loot item.")
-        print("2. List looted items.")
-        print("0. Quit.")
-        print("==================================")
+        sys.stdout.write(_MAIN_MENU)
 
     def handle_choice(self, choice):
         """Handle the choice made by the user."""
@@ -51,8 +55,7 @@ class MainMenu(Screen):
         elif choice == "2":
             self.list_looted_items()
         elif choice == "0":
-            
-            exit()
+            return _QUIT
         else:
             print("Invalid choice. Try again.")
     
@@ -60,9 +63,10 @@ class MainMenu(Screen):
         """Loot an item by asking the user for the item name."""
         while True:
             item_name = input("Enter the name of the item: ")
-            item = self.items.get_item_by_name(item_name)
+            key = item_name.strip().lower()  # Normalised once for both lookups
+            item = self.items.get_item_by_key(key)
             if(not item):
-                item = self.containers.get_container_by_name(item_name)
+                item = self.containers.get_container_by_key(key)
 
             if item:
                 self.container.add_item(item)
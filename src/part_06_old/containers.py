@@ -1,14 +1,24 @@
 import csv
-import copy
-from typing import List
+from operator import attrgetter
+from typing import Dict, List
 from items import Item
 
 class Container(Item):
+    __slots__ = ('weight_capacity', 'items', '_sub_containers', '_leaf_items', 'is_multi_container',
+                 '_used_capacity', '_child_capacity', '_child_items_weight')
+    is_container = True
+
     def __init__(self, name: str, weight: int, weight_capacity: int):
         super().__init__(name, weight)
         self.weight_capacity = weight_capacity
-        self.items: List[Item] = []
+        self.items: List[Item] = []  # Everything stored here, in insertion order
+        # The same items split by kind, so the fit search and the totals never have to type-check
+        self._sub_containers: List['Container'] = []
+        self._leaf_items: List[Item] = []
         self.is_multi_container = False
+        self._used_capacity = 0  # Weight of the items stored directly in this container
+        self._child_capacity = 0  # Sum of child containers' capacities
+        self._child_items_weight = 0  # Weight of the items stored directly in child containers
 
     def __str__(self) -> str:
         capacity_display = f"{self.get_current_weight()}/{self.weight_capacity}"
@@ -21,7 +31,7 @@ class Container(Item):
     def load_items(cls, file_path: str = None, items: List[Item] = None) -> 'Container':
         instance = cls("", 0, 0)
         if file_path:
-            with open(file_path, 'r') as file:
+            with open(file_path, 'r', newline='', encoding='utf-8') as file:
                 reader = csv.reader(file)
                 next(reader)
                 for name, weight in reader:
@@ -32,21 +42,36 @@ class Container(Item):
         return instance
 
     def add_item(self, item: Item):
-        if isinstance(item, Container):
+        if item.is_container:
             self.items.append(item)
+            self._sub_containers.append(item)
             self.is_multi_container = True
             self.weight += item.get_current_weight()
             self.weight_capacity += item.weight_capacity
+            self._child_capacity += item.weight_capacity
+            self._child_items_weight += item.get_item_weight()
         else:
-            for container in self.items:
-                if(isinstance(container, Container)):
-                    return container.add_item(item)
-                
-            if item.get_current_weight() + self.get_c() <= self.weight_capacity - self.get_child_container_capacity():
-                self.items.append(item)
-                print(f"Success! Item \"{item.name}\" stored in container \"{self.name}\".")
+            # Follow the first child container down, as the recursive calls did, without a call per level
+            parent, container = None, self
+            while container._sub_containers:
+                child = container._sub_containers[0]
+                if isinstance(child, MagicContainer):
+                    # Magic containers search their own compartments
+                    stored_before = child.get_item_weight()
+                    stored = child.add_item(item)
+                    container._child_items_weight += child.get_item_weight() - stored_before
+                    return stored
+                parent, container = container, child
+
+            if item.get_current_weight() + container.get_item_weight() <= container.weight_capacity - container.get_child_container_capacity():
+                container.items.append(item)
+                container._leaf_items.append(item)
+                container._used_capacity += item.get_current_weight()
+                if parent is not None:
+                    parent._child_items_weight += item.get_current_weight()
+                print(f"Success! Item \"{item.name}\" stored in container \"{container.name}\".")
             else:
-                print(f"Failure! Item \"{item.name}\" NOT stored in container \"{self.name}\".")
+                print(f"Failure! Item \"{item.name}\" NOT stored in container \"{container.name}\".")
                 return False
         return True
 
@@ -54,20 +79,35 @@ class Container(Item):
         for item in items:
             self.add_item(item)
 
+    def clone(self) -> 'Container':
+        container = type(self)(self.name, self.weight, self.weight_capacity)
+        for item in self.items:
+            if item.is_container:
+                item = item.clone()
+                container._sub_containers.append(item)
+            else:
+                container._leaf_items.append(item)
+            container.items.append(item)
+        container.is_multi_container = self.is_multi_container
+        container._used_capacity = self._used_capacity
+        container._child_capacity = self._child_capacity
+        container._child_items_weight = self._child_items_weight
+        return container
+
     def get_child_container_capacity(self):
-        return sum(item.weight_capacity for item in self.items if isinstance(item, Container))
+        return self._child_capacity
 
     def get_current_weight(self):
-        return self.weight + sum(item.get_item_weight() for item in self.items)
+        return self.weight + self._used_capacity + self._child_items_weight
     
     def get_item_weight(self):
-        return sum(item.get_current_weight() for item in self.items if not isinstance(item, Container))
+        return self._used_capacity
 
     def list_items(self, depth=1):
         print(self)
-        for item in sorted(self.items, key=lambda x: x.name):
+        for item in sorted(self.items, key=attrgetter('name')):
             indent = "   " * depth
-            if isinstance(item, Container):
+            if item.is_container:
                 print(indent, end="")
                 item.list_items(depth + 1)
             else:
@@ -83,22 +123,33 @@ class Container(Item):
         return len(self.items)
     
 class MagicContainer(Container):
+    __slots__ = ()
+
     def __init__(self, name: str, weight: int, weight_capacity: int):
         super().__init__(name, weight, weight_capacity)
 
     def add_item(self, item: Item):
-        if isinstance(item, Container):
+        if item.is_container:
             self.items.append(item)
+            self._sub_containers.append(item)
             self.is_multi_container = True
             self.weight_capacity += item.weight_capacity
+            self._child_capacity += item.weight_capacity
+            self._child_items_weight += item.get_item_weight()
         else:
-            for container in self.items:
-                if(isinstance(container, Container)):
-                    if(container.add_item(item)):
-                        return True
+            for container in self._sub_containers:
+                stored_before = container.get_item_weight()
+                stored = container.add_item(item)
+                self._child_items_weight += container.get_item_weight() - stored_before
+                if(stored):
+                    return True
                 
-            if self.get_magic_capacity_filled() + item.get_current_weight() <= self.weight_capacity - self.get_child_container_capacity():
+            item_weight = item.get_current_weight()
+            # Only the items stored here count against the magic capacity, not those in compartments
+            if self._used_capacity + item_weight <= self.weight_capacity - self._child_capacity:
                 self.items.append(item)
+                self._leaf_items.append(item)
+                self._used_capacity += item_weight
                 print(f"Success! Item \"{item.name}\" stored in container \"{self.name}\".")
             else:
                 print(f"Failure! Item \"{item.name}\" NOT stored in container \"{self.name}\".")
@@ -110,10 +161,15 @@ class MagicContainer(Container):
         instance = cls(magic_name, container.weight, container.weight_capacity)
         instance.is_multi_container = container.is_multi_container
         instance.items = container.items
+        instance._sub_containers = container._sub_containers
+        instance._leaf_items = container._leaf_items
+        instance._used_capacity = container._used_capacity
+        instance._child_capacity = container._child_capacity
+        instance._child_items_weight = container._child_items_weight
         return instance
    
     def get_magic_capacity_filled(self):
-        return sum(item.get_current_weight() for item in self.items if not isinstance(item, Container))
+        return self._used_capacity
 
     def get_current_weight(self):
         return self.weight
@@ -126,6 +182,7 @@ class MagicContainer(Container):
 class ContainerManager:
     def __init__(self):
         self.containers: List[Container] = []  # Initialize as an empty list
+        self._by_name: Dict[str, Container] = {}  # Normalised name -> container
 
     @classmethod
     def load_containers(cls, containers_file_path: str = None, multi_container_file_path: str = None, magic_container_file_path: str = None, multi_magic_container_file_path: str = None) -> 'ContainerManager':
@@ -133,30 +190,31 @@ class ContainerManager:
 
         # Load regular containers if the file path is provided
         if containers_file_path:
-            with open(containers_file_path, 'r') as file:
+            with open(containers_file_path, 'r', newline='', encoding='utf-8') as file:
                 reader = csv.reader(file)
                 next(reader)  # Skip header
-                instance.containers = [
+                instance.add_container([
                     Container(name, int(empty), int(capacity))
                     for name, empty, capacity in reader
-                ]
+                ])
 
         # Load multi containers if the file path is provided
         if multi_container_file_path:
-            with open(multi_container_file_path, 'r') as file:
+            with open(multi_container_file_path, 'r', newline='', encoding='utf-8') as file:
                 reader = csv.reader(file)
                 next(reader)  # Skip header
+                get_container_by_name = instance.get_container_by_name
                 for row in reader:
                     mother_container = Container(row[0], 0, 0)  # First entry is the mother container name
                     for child_name in row[1:]:
-                        child_container = instance.get_container_by_name(child_name)
+                        child_container = get_container_by_name(child_name)
                         if child_container:
                             mother_container.add_item(child_container)
-                    instance.containers.append(mother_container)
+                    instance.add_container([mother_container])
 
         # Load magic containers if the file path is provided
         if magic_container_file_path:
-            with open(magic_container_file_path, 'r') as file:
+            with open(magic_container_file_path, 'r', newline='', encoding='utf-8') as file:
                 reader = csv.reader(file)
                 next(reader)  # Skip header
                 for row in reader:
@@ -164,11 +222,11 @@ class ContainerManager:
                     normal_container = instance.get_container_by_name(container_name)
                     if normal_container:
                         magic_container = MagicContainer.convert_container_to_magic(normal_container, magic_container_name)
-                        instance.containers.append(magic_container)
+                        instance.add_container([magic_container])
 
         # Load multi-magic containers if the file path is provided
         if multi_magic_container_file_path:
-            with open(multi_magic_container_file_path, 'r') as file:
+            with open(multi_magic_container_file_path, 'r', newline='', encoding='utf-8') as file:
                 reader = csv.reader(file)
                 next(reader)  # Skip header
                 for row in reader:
@@ -176,25 +234,27 @@ class ContainerManager:
                     normal_container = instance.get_container_by_name(container_name)
                     if normal_container:
                         magic_container = MagicContainer.convert_container_to_magic(normal_container, magic_container_name)
-                        instance.containers.append(magic_container)
+                        instance.add_container([magic_container])
 
         return instance
 
 
     def print_containers(self):
-        for container in sorted(self.containers, key=lambda x: x.name):
+        for container in sorted(self.containers, key=attrgetter('name')):
             container.list_items()  # Assuming `Container` class has print_items()
 
     def add_container(self, containers: List[Container]):
         self.containers.extend(containers)
+        for container in containers:
+            self._by_name.setdefault(container._key, container)
 
     def get_containers(self) -> List[Container]:
         return self.containers
 
     def get_container_by_name(self, container_name: str) -> Container:
-        for container in self.containers:
-            if container.name.strip().lower() == container_name.strip().lower():
-                return copy.deepcopy(container)
+        container = self._by_name.get(container_name.strip().lower())
+        if container:
+            return container.clone()
         return None
 
     def get_count(self) -> int: